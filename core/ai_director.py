@@ -5,14 +5,67 @@ Coordinates multiple AI services and applies forcing functions.
 Handles context management, conversation flow, and response generation.
 """
 
-import json
 import random
 import re
-from typing import Dict, List, Any, Optional
+from collections import deque
+from typing import Dict, List, Any, Optional, Tuple, Deque
 from datetime import datetime
 from pathlib import Path
 
 
+# Simple questions answered from state, matched in one pass
+_SIMPLE_QUESTION_RE = re.compile(
+    r"what\s+is\s+\w+"
+    r"|where\s+is\s+\w+"
+    r"|who\s+is\s+\w+"
+    r"|show\s+me\s+\w+"
+    r"|list\s+\w+"
+)
+
+# Quoted-argument gameplay command patterns
+_EVIDENCE_ADD_RE = re.compile(r"add ['\"]([^'\"]+)['\"] ['\"]([^'\"]+)['\"]")
+_CHARACTER_MEET_RE = re.compile(r"meet ['\"]([^'\"]+)['\"] ['\"]([^'\"]+)['\"]")
+_DICE_ROLL_RE = re.compile(r"(?:dice\s+)?roll ['\"]([^'\"]+)['\"]")
+_SAVE_RE = re.compile(r"save ['\"]([^'\"]+)['\"]")
+
+# Exact-match commands with canned responses
+_QUICK_COMMANDS = {
+    "evidence list": "📋 Evidence collected: [evidence would be listed here]",
+    "character list": "👥 Characters met: [characters would be listed here]",
+    "status": "📊 Current status: [status would be shown here]"
+}
+
+# Contextual actions offered per game phase
+_PHASE_ACTIONS = {
+    "investigation": (
+        "gather evidence",
+        "interview witness",
+        "examine location",
+        "present evidence to character",
+        "check trial readiness"
+    ),
+    "trial": (
+        "call witness",
+        "start cross-examination",
+        "present evidence",
+        "object to testimony",
+        "give closing argument"
+    )
+}
+_DEFAULT_ACTIONS = ("continue case", "check status", "save progress")
+
+# Basic word list for forcing functions, shared by every manager
+_INSPIRATION_WORDS = (
+    "apple", "bridge", "candle", "diamond", "elephant", "feather", "guitar",
+    "hammer", "island", "jacket", "keyboard", "ladder", "mirror", "needle",
+    "ocean", "pencil", "question", "rainbow", "shadow", "telescope", "umbrella",
+    "violin", "whisper", "xylophone", "yellow", "zebra", "anchor", "butterfly",
+    "crystal", "dragon", "emerald", "flame", "ghost", "harvest", "ink", "journey",
+    "knot", "lightning", "mountain", "night", "opal", "puzzle", "quilt", "river",
+    "star", "thunder", "universe", "valley", "wind", "xenon", "youth", "zephyr"
+)
+
+
 class AIDirector:
     """Central coordinator for AI-driven gameplay"""
     
@@ -42,7 +95,7 @@ class AIDirector:
             return command_result
         
         # Determine if we need forcing function
-        requires_improvisation = self._requires_improvisation(user_input, game_state)
+        requires_improvisation = self._requires_improvisation(user_input)
         
         if requires_improvisation:
             # Apply forcing function for improvised response
@@ -89,16 +142,7 @@ class AIDirector:
             return self._handle_save_command(input_lower, game_state)
         
         # Quick commands
-        quick_commands = {
-            "evidence list": "📋 Evidence collected: [evidence would be listed here]",
-            "character list": "👥 Characters met: [characters would be listed here]", 
-            "status": "📊 Current status: [status would be shown here]"
-        }
-        
-        if input_lower in quick_commands:
-            return quick_commands[input_lower]
-        
-        return None
+        return _QUICK_COMMANDS.get(input_lower)
     
     def _handle_evidence_command(self, command: str, game_state: Dict[str, Any]) -> str:
         """Handle evidence-related commands"""
@@ -116,7 +160,7 @@ class AIDirector:
         
         elif "add" in command:
             # Parse "evidence add 'name' 'description'"
-            match = re.search(r"add ['\"]([^'\"]+)['\"] ['\"]([^'\"]+)['\"]", command)
+            match = _EVIDENCE_ADD_RE.search(command)
             if match:
                 name, description = match.groups()
                 return f"✅ Added evidence: {name} - {description}"
@@ -142,7 +186,7 @@ class AIDirector:
         
         elif "meet" in command:
             # Parse "character meet 'name' 'role'"
-            match = re.search(r"meet ['\"]([^'\"]+)['\"] ['\"]([^'\"]+)['\"]", command)
+            match = _CHARACTER_MEET_RE.search(command)
             if match:
                 name, role = match.groups()
                 return f"👋 Met {name}, {role}"
@@ -155,7 +199,7 @@ class AIDirector:
         """Handle dice rolling commands"""
         
         # Parse "dice roll 'action'" or "roll 'action'"
-        match = re.search(r"(?:dice\s+)?roll ['\"]([^'\"]+)['\"]", command)
+        match = _DICE_ROLL_RE.search(command)
         if match:
             action = match.group(1)
             
@@ -181,7 +225,7 @@ class AIDirector:
         """Handle save game commands"""
         
         # Parse save name
-        match = re.search(r"save ['\"]([^'\"]+)['\"]", command)
+        match = _SAVE_RE.search(command)
         if match:
             save_name = match.group(1)
             return f"💾 Game saved as '{save_name}'"
@@ -189,39 +233,16 @@ class AIDirector:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             return f"💾 Game saved as 'auto_save_{timestamp}'"
     
-    def _requires_improvisation(self, user_input: str, game_state: Dict[str, Any]) -> bool:
-        """Determine if user input requires improvised AI response"""
-        
-        # Commands don't require improvisation
-        if self._parse_gameplay_commands(user_input, game_state):
-            return False
+    def _requires_improvisation(self, user_input: str) -> bool:
+        """Determine if user input requires improvised AI response (input must not be a command)"""
         
         # Simple questions might not need improvisation
-        simple_patterns = [
-            r"what\s+is\s+\w+",
-            r"where\s+is\s+\w+", 
-            r"who\s+is\s+\w+",
-            r"show\s+me\s+\w+",
-            r"list\s+\w+"
-        ]
-        
         input_lower = user_input.lower()
-        for pattern in simple_patterns:
-            if re.search(pattern, input_lower):
-                return False
-        
-        # Complex interactions, character dialogue, plot development = improvisation
-        improvisation_indicators = [
-            "talk to", "ask", "confront", "investigate", "examine",
-            "what happens", "what does", "how does", "why did",
-            "tell me about", "explain", "describe"
-        ]
-        
-        for indicator in improvisation_indicators:
-            if indicator in input_lower:
-                return True
-        
-        # Default to improvisation for safety
+        if _SIMPLE_QUESTION_RE.search(input_lower):
+            return False
+        
+        # Complex interactions, character dialogue, plot development and
+        # anything unrecognised all default to improvisation
         return True
     
     def _generate_improvised_response(self, user_input: str, 
@@ -299,35 +320,16 @@ Available Actions:
         
         phase = game_state.get("phase", "investigation")
         
-        if phase == "investigation":
-            return [
-                "gather evidence",
-                "interview witness", 
-                "examine location",
-                "present evidence to character",
-                "check trial readiness"
-            ]
-        elif phase == "trial":
-            return [
-                "call witness",
-                "start cross-examination",
-                "present evidence",
-                "object to testimony",
-                "give closing argument"
-            ]
-        else:
-            return [
-                "continue case",
-                "check status",
-                "save progress"
-            ]
+        # Copy so callers can't mutate the shared table
+        return list(_PHASE_ACTIONS.get(phase, _DEFAULT_ACTIONS))
 
 
 class ForcingFunctionManager:
     """Manages forcing functions for AI improvisation"""
     
     def __init__(self):
-        self.inspiration_history: List[Dict[str, Any]] = []
+        # Bounded so old entries drop off without periodic list rebuilds
+        self.inspiration_history: Deque[Dict[str, Any]] = deque(maxlen=100)
         
         # Load word list for forcing functions
         self.word_list = self._load_word_list()
@@ -344,10 +346,6 @@ class ForcingFunctionManager:
             "context": "random_inspiration"
         })
         
-        # Keep history manageable
-        if len(self.inspiration_history) > 100:
-            self.inspiration_history = self.inspiration_history[-50:]
-        
         return word
     
     def get_contextual_inspiration(self, context: str) -> str:
@@ -361,20 +359,11 @@ class ForcingFunctionManager:
         
         return word
     
-    def _load_word_list(self) -> List[str]:
+    def _load_word_list(self) -> Tuple[str, ...]:
         """Load word list for inspiration"""
         
-        # Basic word list for forcing functions
         # In real implementation, would use wonderwords package
-        return [
-            "apple", "bridge", "candle", "diamond", "elephant", "feather", "guitar",
-            "hammer", "island", "jacket", "keyboard", "ladder", "mirror", "needle",
-            "ocean", "pencil", "question", "rainbow", "shadow", "telescope", "umbrella",
-            "violin", "whisper", "xylophone", "yellow", "zebra", "anchor", "butterfly",
-            "crystal", "dragon", "emerald", "flame", "ghost", "harvest", "ink", "journey",
-            "knot", "lightning", "mountain", "night", "opal", "puzzle", "quilt", "river",
-            "star", "thunder", "universe", "valley", "wind", "xenon", "youth", "zephyr"
-        ]
+        return _INSPIRATION_WORDS
 
 
 class ContextManager:
@@ -382,7 +371,7 @@ class ContextManager:
     
     def __init__(self):
         self.context_window_size = 50  # Number of exchanges to remember
-        self.key_events: List[Dict[str, Any]] = []
+        self.key_events: Deque[Dict[str, Any]] = deque(maxlen=20)
     
     def add_key_event(self, event_type: str, description: str, 
                      metadata: Dict[str, Any] = None) -> None:
@@ -395,11 +384,7 @@ class ContextManager:
             "timestamp": datetime.now().isoformat()
         }
         
-        self.key_events.append(event)
-        
-        # Keep reasonable size
-        if len(self.key_events) > 20:
-            self.key_events = self.key_events[-15:]
+        self.key_events.append(event)  # Oldest event drops off past 20
     
     def get_context_summary(self) -> str:
         """Get summary of key events for context restoration"""
@@ -408,7 +393,7 @@ class ContextManager:
             return "No significant events recorded."
         
         summary = ["Key Events:"]
-        for event in self.key_events[-10:]:  # Last 10 events
+        for event in list(self.key_events)[-10:]:  # Last 10 events
             summary.append(f"- {event['description']}")
         
         return "\n".join(summary)
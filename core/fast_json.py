@@ -0,0 +1,22 @@
+"""
+Fast JSON Serialization
+
+Thin adapter over orjson for event log persistence on the per-turn hot path.
+"""
+
+from typing import Any, Union
+
+import orjson
+
+
+JSONDecodeError = orjson.JSONDecodeError
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON from bytes or str"""
+    return orjson.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize object to UTF-8 encoded JSON bytes"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
@@ -7,22 +7,80 @@ Prevents duplicate characters and maintains consistency.
 
 import uuid
 import random
-from typing import Dict, List, Any, Optional
+from itertools import product
+from typing import Dict, List, Any, Optional, Set
 from datetime import datetime
 
 
 class CharacterPlugin:
     """Manages character introductions and relationships"""
     
+    # Age range per role keyword, checked in order
+    _AGE_RANGES = {
+        "judge": (45, 70),
+        "prosecutor": (28, 55),
+        "detective": (25, 50),
+        "police": (21, 55),
+        "lawyer": (25, 60),
+        "doctor": (28, 65),
+        "student": (18, 30),
+        "security": (21, 55),
+        "witness": (18, 80),
+        "client": (18, 70)
+    }
+    
+    # Fixed occupation per role keyword, checked in order
+    _ROLE_OCCUPATIONS = {
+        "judge": "Judge",
+        "prosecutor": "Prosecutor", 
+        "detective": "Detective",
+        "police": "Police Officer",
+        "lawyer": "Lawyer",
+        "doctor": "Doctor",
+        "security": "Security Guard"
+    }
+    
+    # Generic occupations by age bracket
+    _JUNIOR_OCCUPATIONS = ("Student", "Intern", "Assistant", "Clerk")
+    _SENIOR_OCCUPATIONS = ("Retired", "Consultant", "Professor", "Manager")
+    _GENERAL_OCCUPATIONS = (
+        "Accountant", "Teacher", "Engineer", "Manager", "Salesperson",
+        "Nurse", "Technician", "Analyst", "Coordinator", "Specialist"
+    )
+    
+    # Roles limited to one character per case
+    _CRITICAL_ROLES = frozenset({"prosecutor", "judge", "client"})
+    
+    # Roles that must be present before trial, in reporting order
+    _REQUIRED_ROLES = ("prosecutor", "client")
+    
+    _PERSONALITIES = (
+        "Adamant", "Bashful", "Bold", "Brave", "Calm", "Careful", "Docile", 
+        "Gentle", "Hardy", "Hasty", "Impish", "Jolly", "Lax", "Lonely", 
+        "Mild", "Modest", "Naive", "Naughty", "Quiet", "Quirky", "Rash", 
+        "Relaxed", "Sassy", "Serious", "Timid"
+    )
+    
     def __init__(self):
         self.characters: Dict[str, Dict[str, Any]] = {}
-        self.used_names: List[str] = []
+        self.used_names: Set[str] = set()
+        self._ids_by_name: Dict[str, str] = {}  # Lowercase name -> character ID
         self.name_generator = CharacterNameGenerator()
     
     def load_state(self, character_data: Dict[str, Any]) -> None:
         """Load character state from game state"""
-        self.characters = character_data.copy()
-        self.used_names = [char["name"] for char in self.characters.values()]
+        self.characters = {}
+        self.used_names = set()
+        self._ids_by_name = {}
+        
+        # Copy records so plugin mutations don't write through to cached state,
+        # building both name lookups in the same pass
+        for character_id, char in character_data.items():
+            char = {**char, "relationships": dict(char["relationships"]),
+                    "secrets": list(char["secrets"])}
+            self.characters[character_id] = char
+            self.used_names.add(char["name"])
+            self._ids_by_name[char["name"].lower()] = character_id
     
     def meet_character(self, name: str, role: str,
                       age: Optional[int] = None,
@@ -39,15 +97,14 @@ class CharacterPlugin:
         
         # Check for duplicate names (case-insensitive)
         name_lower = name.lower().strip()
-        for existing_id, existing_char in self.characters.items():
-            if existing_char["name"].lower() == name_lower:
-                raise ValueError(f"Character already exists: {existing_char['name']}")
+        existing_id = self._ids_by_name.get(name_lower)
+        if existing_id is not None:
+            raise ValueError(f"Character already exists: {self.characters[existing_id]['name']}")
         
         # Check for duplicate critical roles
-        critical_roles = ["prosecutor", "judge", "client"]
         role_lower = role.lower().strip()
         
-        if role_lower in critical_roles:
+        if role_lower in self._CRITICAL_ROLES:
             for existing_char in self.characters.values():
                 if existing_char["role"].lower() == role_lower:
                     raise ValueError(f"Only one {role_lower} allowed per case")
@@ -81,7 +138,8 @@ class CharacterPlugin:
         
         # Store character
         self.characters[character_id] = character_data
-        self.used_names.append(name.strip())
+        self.used_names.add(name.strip())
+        self._ids_by_name[name_lower] = character_id
         
         return character_data
     
@@ -91,11 +149,10 @@ class CharacterPlugin:
     
     def find_character_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Find character by name (case-insensitive)"""
-        name_lower = name.lower()
-        for character in self.characters.values():
-            if character["name"].lower() == name_lower:
-                return character
-        return None
+        character_id = self._ids_by_name.get(name.lower())
+        if character_id is None:
+            return None
+        return self.characters.get(character_id)
     
     def list_characters(self) -> List[Dict[str, Any]]:
         """List all characters sorted by trust level"""
@@ -166,8 +223,7 @@ class CharacterPlugin:
         
         # Check for required roles
         roles_present = {char["role"].lower() for char in character_list}
-        required_roles = ["prosecutor", "client"]
-        missing_roles = [role for role in required_roles if role not in roles_present]
+        missing_roles = [role for role in self._REQUIRED_ROLES if role not in roles_present]
         
         # Count character types
         witnesses = [c for c in character_list if "witness" in c["role"].lower()]
@@ -197,14 +253,16 @@ class CharacterPlugin:
     def generate_unique_name(self, role: str = "") -> str:
         """Generate unique character name that hasn't been used"""
         
-        attempts = 0
-        while attempts < 50:  # Prevent infinite loop
-            name = self.name_generator.generate_name(role)
-            
-            if name not in self.used_names:
-                return name
-            
-            attempts += 1
+        # Every random draw would collide once all pool names are taken
+        if not CharacterNameGenerator.pool_names.issubset(self.used_names):
+            attempts = 0
+            while attempts < 50:  # Prevent infinite loop
+                name = self.name_generator.generate_name(role)
+                
+                if name not in self.used_names:
+                    return name
+                
+                attempts += 1
         
         # Fallback to UUID-based name
         return f"Character_{uuid.uuid4().hex[:6]}"
@@ -228,21 +286,8 @@ class CharacterPlugin:
         """Generate appropriate age for character role"""
         role_lower = role.lower()
         
-        age_ranges = {
-            "judge": (45, 70),
-            "prosecutor": (28, 55),
-            "detective": (25, 50),
-            "police": (21, 55),
-            "lawyer": (25, 60),
-            "doctor": (28, 65),
-            "student": (18, 30),
-            "security": (21, 55),
-            "witness": (18, 80),
-            "client": (18, 70)
-        }
-        
         # Find matching role
-        for role_key, (min_age, max_age) in age_ranges.items():
+        for role_key, (min_age, max_age) in self._AGE_RANGES.items():
             if role_key in role_lower:
                 return random.randint(min_age, max_age)
         
@@ -254,40 +299,21 @@ class CharacterPlugin:
         role_lower = role.lower()
         
         # Direct role mappings
-        occupation_mappings = {
-            "judge": "Judge",
-            "prosecutor": "Prosecutor", 
-            "detective": "Detective",
-            "police": "Police Officer",
-            "lawyer": "Lawyer",
-            "doctor": "Doctor",
-            "security": "Security Guard"
-        }
-        
-        for role_key, occupation in occupation_mappings.items():
+        for role_key, occupation in self._ROLE_OCCUPATIONS.items():
             if role_key in role_lower:
                 return occupation
         
         # Age-based occupations for generic roles
         if age < 25:
-            return random.choice(["Student", "Intern", "Assistant", "Clerk"])
+            return random.choice(self._JUNIOR_OCCUPATIONS)
         elif age > 60:
-            return random.choice(["Retired", "Consultant", "Professor", "Manager"])
+            return random.choice(self._SENIOR_OCCUPATIONS)
         else:
-            return random.choice([
-                "Accountant", "Teacher", "Engineer", "Manager", "Salesperson",
-                "Nurse", "Technician", "Analyst", "Coordinator", "Specialist"
-            ])
+            return random.choice(self._GENERAL_OCCUPATIONS)
     
     def _generate_personality(self) -> str:
         """Generate random personality trait"""
-        personalities = [
-            "Adamant", "Bashful", "Bold", "Brave", "Calm", "Careful", "Docile", 
-            "Gentle", "Hardy", "Hasty", "Impish", "Jolly", "Lax", "Lonely", 
-            "Mild", "Modest", "Naive", "Naughty", "Quiet", "Quirky", "Rash", 
-            "Relaxed", "Sassy", "Serious", "Timid"
-        ]
-        return random.choice(personalities)
+        return random.choice(self._PERSONALITIES)
     
     def _assess_initial_credibility(self, role: str) -> int:
         """Assess initial character credibility based on role"""
@@ -308,19 +334,29 @@ class CharacterPlugin:
     def _get_trust_distribution(self) -> Dict[str, int]:
         """Get distribution of character trust levels"""
         
-        hostile = len([c for c in self.characters.values() if c["trust_level"] < -2])
-        unfriendly = len([c for c in self.characters.values() if -2 <= c["trust_level"] < 0])
-        neutral = len([c for c in self.characters.values() if c["trust_level"] == 0])
-        friendly = len([c for c in self.characters.values() if 0 < c["trust_level"] <= 5])
-        very_friendly = len([c for c in self.characters.values() if c["trust_level"] > 5])
-        
-        return {
-            "hostile": hostile,
-            "unfriendly": unfriendly, 
-            "neutral": neutral,
-            "friendly": friendly,
-            "very_friendly": very_friendly
+        distribution = {
+            "hostile": 0,
+            "unfriendly": 0,
+            "neutral": 0,
+            "friendly": 0,
+            "very_friendly": 0
         }
+        
+        # Classify each character once
+        for character in self.characters.values():
+            trust = character["trust_level"]
+            if trust < -2:
+                distribution["hostile"] += 1
+            elif trust < 0:
+                distribution["unfriendly"] += 1
+            elif trust == 0:
+                distribution["neutral"] += 1
+            elif trust <= 5:
+                distribution["friendly"] += 1
+            else:
+                distribution["very_friendly"] += 1
+        
+        return distribution
     
     def _get_character_recommendations(self, character_list: List[Dict[str, Any]]) -> List[str]:
         """Get recommendations for character development"""
@@ -402,20 +438,23 @@ class CharacterPlugin:
 class CharacterNameGenerator:
     """Generates unique character names"""
     
-    def __init__(self):
-        self.first_names = [
-            "Alice", "Bob", "Carol", "David", "Emma", "Frank", "Grace", "Henry",
-            "Iris", "Jack", "Kate", "Leo", "Mary", "Nathan", "Olivia", "Paul",
-            "Quinn", "Rachel", "Sam", "Tina", "Uma", "Victor", "Wendy", "Xavier",
-            "Yvonne", "Zack", "Anna", "Ben", "Claire", "Dan", "Eva", "Felix"
-        ]
-        
-        self.last_names = [
-            "Anderson", "Brown", "Clark", "Davis", "Evans", "Fisher", "Garcia",
-            "Harris", "Jackson", "King", "Lee", "Miller", "Nelson", "Parker",
-            "Quinn", "Roberts", "Smith", "Taylor", "Wilson", "Young", "Allen",
-            "Baker", "Cooper", "Green", "Hall", "Johnson", "Lewis", "Moore"
-        ]
+    # Name pools are shared by every generator instance
+    first_names = (
+        "Alice", "Bob", "Carol", "David", "Emma", "Frank", "Grace", "Henry",
+        "Iris", "Jack", "Kate", "Leo", "Mary", "Nathan", "Olivia", "Paul",
+        "Quinn", "Rachel", "Sam", "Tina", "Uma", "Victor", "Wendy", "Xavier",
+        "Yvonne", "Zack", "Anna", "Ben", "Claire", "Dan", "Eva", "Felix"
+    )
+    
+    last_names = (
+        "Anderson", "Brown", "Clark", "Davis", "Evans", "Fisher", "Garcia",
+        "Harris", "Jackson", "King", "Lee", "Miller", "Nelson", "Parker",
+        "Quinn", "Roberts", "Smith", "Taylor", "Wilson", "Young", "Allen",
+        "Baker", "Cooper", "Green", "Hall", "Johnson", "Lewis", "Moore"
+    )
+    
+    # Every "First Last" combination the generator can produce
+    pool_names = frozenset(map(" ".join, product(first_names, last_names)))
     
     def generate_name(self, role_hint: str = "") -> str:
         """Generate a random name with optional role consideration"""
@@ -7,10 +7,56 @@ Provides D&D-style mechanics for action success/failure.
 
 import random
 import re
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 
+# Dice notation: NdS+M or NdS-M
+_DICE_EXPRESSION_RE = re.compile(r'(\d*)d(\d+)([+-]\d+)?')
+_NUMBER_RE = re.compile(r'\d+')
+
+# Action phrases per difficulty class, checked easiest first
+_DIFFICULTY_TIERS = (
+    # Very Easy (DC 5)
+    (("casual conversation", "simple question", "basic observation",
+      "read document", "walk to location"), 5),
+    # Easy (DC 8)
+    (("interview cooperative witness", "examine obvious evidence",
+      "ask direct question", "search public area"), 8),
+    # Medium (DC 12)
+    (("confront with evidence", "persuade reluctant witness",
+      "search private area", "analyze complex evidence"), 12),
+    # Hard (DC 15)
+    (("interrogate hostile witness", "break into location",
+      "deceive authority figure", "solve complex puzzle"), 15),
+    # Very Hard (DC 18)
+    (("get confession from killer", "access restricted area",
+      "convince judge to break protocol", "uncover major conspiracy"), 18),
+    # Nearly Impossible (DC 20)
+    (("resurrect the dead", "time travel", "mind reading",
+      "impossible physical feat"), 20)
+)
+
+# Fallback keywords when no full phrase matches, checked in order
+_DIFFICULTY_KEYWORDS = (
+    (("interrogate", "confront", "accuse"), 15),
+    (("persuade", "convince", "negotiate"), 12),
+    (("search", "investigate", "examine"), 10),
+    (("ask", "question", "interview"), 8)
+)
+
+_RESULT_EMOJIS = {
+    "critical_success": "🌟",
+    "great_success": "✅",
+    "success": "☑️",
+    "partial_success": "⚠️",
+    "failure": "❌",
+    "bad_failure": "💥",
+    "critical_failure": "💀"
+}
+
+
 class DicePlugin:
     """Manages dice rolling and action resolution"""
     
@@ -20,7 +66,8 @@ class DicePlugin:
     
     def load_state(self, dice_data: Dict[str, Any]) -> None:
         """Load dice state from game state"""
-        self.roll_history = dice_data.get("history", [])
+        # Copy so new rolls don't write through to cached state
+        self.roll_history = list(dice_data.get("history", []))
     
     def roll_action(self, action: str, modifiers: List[str] = None) -> Dict[str, Any]:
         """Roll dice for an action with automatic difficulty assessment"""
@@ -159,69 +206,23 @@ class DicePlugin:
             "lowest_roll": min(rolls)
         }
     
-    def _assess_action_difficulty(self, action: str) -> int:
-        """Assess action difficulty and return DC"""
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _assess_action_difficulty(action: str) -> int:
+        """Assess action difficulty and return DC (memoized per action text)"""
         
         action_lower = action.lower()
         
-        # Very Easy (DC 5)
-        easy_actions = [
-            "casual conversation", "simple question", "basic observation",
-            "read document", "walk to location"
-        ]
-        
-        # Easy (DC 8)
-        moderate_easy_actions = [
-            "interview cooperative witness", "examine obvious evidence",
-            "ask direct question", "search public area"
-        ]
-        
-        # Medium (DC 12)
-        medium_actions = [
-            "confront with evidence", "persuade reluctant witness",
-            "search private area", "analyze complex evidence"
-        ]
-        
-        # Hard (DC 15)
-        hard_actions = [
-            "interrogate hostile witness", "break into location",
-            "deceive authority figure", "solve complex puzzle"
-        ]
-        
-        # Very Hard (DC 18)
-        very_hard_actions = [
-            "get confession from killer", "access restricted area",
-            "convince judge to break protocol", "uncover major conspiracy"
-        ]
-        
-        # Nearly Impossible (DC 20)
-        extreme_actions = [
-            "resurrect the dead", "time travel", "mind reading",
-            "impossible physical feat"
-        ]
-        
         # Check each difficulty tier
-        for actions, dc in [
-            (easy_actions, 5),
-            (moderate_easy_actions, 8),
-            (medium_actions, 12),
-            (hard_actions, 15),
-            (very_hard_actions, 18),
-            (extreme_actions, 20)
-        ]:
+        for actions, dc in _DIFFICULTY_TIERS:
             for action_pattern in actions:
                 if action_pattern in action_lower:
                     return dc
         
         # Check for keywords to determine difficulty
-        if any(word in action_lower for word in ["interrogate", "confront", "accuse"]):
-            return 15
-        elif any(word in action_lower for word in ["persuade", "convince", "negotiate"]):
-            return 12
-        elif any(word in action_lower for word in ["search", "investigate", "examine"]):
-            return 10
-        elif any(word in action_lower for word in ["ask", "question", "interview"]):
-            return 8
+        for keywords, dc in _DIFFICULTY_KEYWORDS:
+            if any(word in action_lower for word in keywords):
+                return dc
         
         # Default medium difficulty
         return 10
@@ -249,7 +250,7 @@ class DicePlugin:
                 total -= 2
             elif "evidence" in modifier_lower:
                 # Extract evidence count
-                numbers = re.findall(r'\d+', modifier)
+                numbers = _NUMBER_RE.findall(modifier)
                 if numbers:
                     evidence_count = min(int(numbers[0]), 3)
                     total += evidence_count
@@ -317,9 +318,7 @@ class DicePlugin:
         # Default to 1d20
         expression = expression.strip() or "1d20"
         
-        # Parse pattern: NdS+M or NdS-M
-        pattern = r'(\d*)d(\d+)([+-]\d+)?'
-        match = re.match(pattern, expression.lower())
+        match = _DICE_EXPRESSION_RE.match(expression.lower())
         
         if not match:
             # If parsing fails, default to 1d20
@@ -373,13 +372,4 @@ class DicePlugin:
     
     def _get_result_emoji(self, result: str) -> str:
         """Get emoji for dice result"""
-        result_emojis = {
-            "critical_success": "🌟",
-            "great_success": "✅", 
-            "success": "☑️",
-            "partial_success": "⚠️",
-            "failure": "❌",
-            "bad_failure": "💥",
-            "critical_failure": "💀"
-        }
-        return result_emojis.get(result, "❓")
\ No newline at end of file
+        return _RESULT_EMOJIS.get(result, "❓")
\ No newline at end of file
@@ -5,20 +5,40 @@ Handles evidence collection, validation, and organization.
 Prevents duplicate evidence and maintains logical consistency.
 """
 
+import re
 import uuid
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 
+# Significance keywords, each tier matched as one substring alternation
+_HIGH_SIGNIFICANCE_RE = re.compile("|".join(map(re.escape, (
+    "murder weapon", "gun", "knife", "blood", "fingerprint",
+    "dna", "confession", "witness", "alibi", "motive"
+))))
+_MEDIUM_SIGNIFICANCE_RE = re.compile("|".join(map(re.escape, (
+    "clue", "evidence", "proof", "document", "letter",
+    "phone", "camera", "photo", "recording"
+))))
+
+
 class EvidencePlugin:
     """Manages evidence collection and organization"""
     
     def __init__(self):
         self.evidence: Dict[str, Dict[str, Any]] = {}
+        self._ids_by_name: Dict[str, str] = {}  # Lowercase name -> evidence ID
     
     def load_state(self, evidence_data: Dict[str, Any]) -> None:
         """Load evidence state from game state"""
-        self.evidence = evidence_data.copy()
+        self.evidence = {}
+        self._ids_by_name = {}
+        
+        # Copy records so plugin mutations don't write through to cached state
+        for evidence_id, item in evidence_data.items():
+            item = {**item, "tags": list(item["tags"])}
+            self.evidence[evidence_id] = item
+            self._ids_by_name[item["name"].lower()] = evidence_id
     
     def add_evidence(self, name: str, description: str, 
                     location: Optional[str] = None,
@@ -34,9 +54,9 @@ class EvidencePlugin:
         
         # Check for duplicates (case-insensitive)
         name_lower = name.lower().strip()
-        for existing_id, existing_evidence in self.evidence.items():
-            if existing_evidence["name"].lower() == name_lower:
-                raise ValueError(f"Evidence already exists: {existing_evidence['name']}")
+        existing_id = self._ids_by_name.get(name_lower)
+        if existing_id is not None:
+            raise ValueError(f"Evidence already exists: {self.evidence[existing_id]['name']}")
         
         # Generate unique ID
         evidence_id = self._generate_evidence_id(name)
@@ -54,6 +74,7 @@ class EvidencePlugin:
         
         # Store evidence
         self.evidence[evidence_id] = evidence_data
+        self._ids_by_name[name_lower] = evidence_id
         
         return evidence_data
     
@@ -93,8 +114,10 @@ class EvidencePlugin:
         """Add tags to evidence"""
         if evidence_id in self.evidence:
             current_tags = self.evidence[evidence_id]["tags"]
-            new_tags = [tag for tag in tags if tag not in current_tags]
-            self.evidence[evidence_id]["tags"].extend(new_tags)
+            seen = set(current_tags)
+            # dict.fromkeys drops repeats within the request, keeping order
+            new_tags = [tag for tag in dict.fromkeys(tags) if tag not in seen]
+            current_tags.extend(new_tags)
     
     def get_evidence_by_location(self, location: str) -> List[Dict[str, Any]]:
         """Get all evidence found at a specific location"""
@@ -112,33 +135,40 @@ class EvidencePlugin:
         
         evidence_list = list(self.evidence.values())
         
-        # Count by significance
-        high_significance = [e for e in evidence_list if e["significance"] >= 8]
-        medium_significance = [e for e in evidence_list if 5 <= e["significance"] < 8]
-        low_significance = [e for e in evidence_list if e["significance"] < 5]
-        
-        # Check for key evidence types
-        physical_evidence = self.get_evidence_by_tag("physical")
-        witness_testimony = self.get_evidence_by_tag("testimony")
-        documentary_evidence = self.get_evidence_by_tag("document")
+        # Count significance and key evidence types in a single pass
+        high_significance = medium_significance = low_significance = 0
+        physical_evidence = witness_testimony = documentary_evidence = 0
+        for evidence in evidence_list:
+            significance = evidence["significance"]
+            if significance >= 8:
+                high_significance += 1
+            elif significance >= 5:
+                medium_significance += 1
+            else:
+                low_significance += 1
+            
+            tags = {tag.lower() for tag in evidence["tags"]}
+            physical_evidence += "physical" in tags
+            witness_testimony += "testimony" in tags
+            documentary_evidence += "document" in tags
         
         # Trial readiness assessment
         ready_for_trial = (
-            len(high_significance) >= 2 and
+            high_significance >= 2 and
             len(evidence_list) >= 5 and
-            (len(physical_evidence) >= 1 or len(documentary_evidence) >= 1)
+            (physical_evidence >= 1 or documentary_evidence >= 1)
         )
         
         return {
             "ready_for_trial": ready_for_trial,
             "total_evidence": len(evidence_list),
-            "high_significance": len(high_significance),
-            "medium_significance": len(medium_significance),
-            "low_significance": len(low_significance),
+            "high_significance": high_significance,
+            "medium_significance": medium_significance,
+            "low_significance": low_significance,
             "evidence_types": {
-                "physical": len(physical_evidence),
-                "testimony": len(witness_testimony),
-                "documentary": len(documentary_evidence)
+                "physical": physical_evidence,
+                "testimony": witness_testimony,
+                "documentary": documentary_evidence
             },
             "recommendations": self._get_evidence_recommendations(evidence_list)
         }
@@ -165,31 +195,15 @@ class EvidencePlugin:
         
         significance = 5  # Base significance
         
-        name_lower = name.lower()
-        desc_lower = description.lower()
-        
-        # High significance indicators
-        high_sig_keywords = [
-            "murder weapon", "gun", "knife", "blood", "fingerprint", 
-            "dna", "confession", "witness", "alibi", "motive"
-        ]
-        
-        # Medium significance indicators  
-        med_sig_keywords = [
-            "clue", "evidence", "proof", "document", "letter", 
-            "phone", "camera", "photo", "recording"
-        ]
+        # Newline keeps keywords from matching across name and description
+        text = f"{name.lower()}\n{description.lower()}"
         
         # Check for keywords
-        for keyword in high_sig_keywords:
-            if keyword in name_lower or keyword in desc_lower:
-                significance += 3
-                break
-        
-        for keyword in med_sig_keywords:
-            if keyword in name_lower or keyword in desc_lower:
-                significance += 1
-                break
+        if _HIGH_SIGNIFICANCE_RE.search(text):
+            significance += 3
+        
+        if _MEDIUM_SIGNIFICANCE_RE.search(text):
+            significance += 1
         
         # Length factor (more detailed = more significant)
         if len(description) > 100:
@@ -5,10 +5,20 @@ Handles courtroom proceedings, cross-examinations, and evidence presentation.
 Provides authentic Ace Attorney-style trial mechanics.
 """
 
-from typing import Dict, List, Any, Optional
+import random
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 
+# Fallback hints when no situation-specific hint applies
+_GENERAL_HINTS = (
+    "Look for statements that contradict your evidence.",
+    "Press statements that seem suspicious for more details.",
+    "Present evidence that directly contradicts what the witness said.",
+    "Pay attention to specific details in statements that don't match evidence."
+)
+
+
 class TrialPlugin:
     """Manages trial proceedings and courtroom mechanics"""
     
@@ -22,13 +32,18 @@ class TrialPlugin:
             "max_penalties": 5
         }
         self.witness_statements: List[Dict[str, Any]] = []
+        self._statements_by_id: Dict[str, Dict[str, Any]] = {}
         self.testimony_history: List[Dict[str, Any]] = []
     
     def load_state(self, trial_data: Dict[str, Any]) -> None:
         """Load trial state from game state"""
-        self.trial_state.update(trial_data.get("state", {}))
-        self.witness_statements = trial_data.get("statements", [])
-        self.testimony_history = trial_data.get("history", [])
+        # Copy records so plugin mutations don't write through to cached state
+        state = trial_data.get("state", {})
+        self.trial_state.update(state)
+        if "evidence_presented" in state:
+            self.trial_state["evidence_presented"] = list(state["evidence_presented"])
+        self._set_statements([dict(s) for s in trial_data.get("statements", [])])
+        self.testimony_history = list(trial_data.get("history", []))
     
     def start_trial(self, prosecutor_name: str, judge_name: str) -> Dict[str, Any]:
         """Begin trial proceedings"""
@@ -89,7 +104,7 @@ class TrialPlugin:
                 "contradicted": False
             })
         
-        self.witness_statements = statement_objects
+        self._set_statements(statement_objects)
         
         self.trial_state.update({
             "cross_examination": {
@@ -231,7 +246,7 @@ class TrialPlugin:
         self.trial_state["cross_examination"] = None
         self.trial_state["current_witness"] = None
         self.trial_state["phase"] = "trial_proceedings"
-        self.witness_statements = []
+        self._set_statements([])
         
         if victory:
             return {
@@ -257,15 +272,14 @@ class TrialPlugin:
         
         exam = self.trial_state["cross_examination"]
         
-        pressed_statements = [s for s in self.witness_statements if s["pressed"]]
-        contradicted_statements = [s for s in self.witness_statements if s["contradicted"]]
+        pressed_count, contradicted_count = self._count_statement_flags()
         
         return {
             "active": True,
             "witness": exam["witness"],
             "statements_count": len(self.witness_statements),
-            "pressed_count": len(pressed_statements),
-            "contradicted_count": len(contradicted_statements),
+            "pressed_count": pressed_count,
+            "contradicted_count": contradicted_count,
             "penalties": self.trial_state["penalties"],
             "max_penalties": self.trial_state["max_penalties"],
             "evidence_presented": len(self.trial_state["evidence_presented"]),
@@ -316,8 +330,7 @@ class TrialPlugin:
             return "No active cross-examination. Call a witness to begin testimony."
         
         # Analyze current situation
-        pressed_count = len([s for s in self.witness_statements if s["pressed"]])
-        contradicted_count = len([s for s in self.witness_statements if s["contradicted"]])
+        pressed_count, contradicted_count = self._count_statement_flags()
         
         # Evidence-based hints
         evidence_count = context.get("evidence_count", 0)
@@ -336,44 +349,39 @@ class TrialPlugin:
             return "Be careful! Too many wrong evidence presentations will end your case."
         
         # General hints
-        hints = [
-            "Look for statements that contradict your evidence.",
-            "Press statements that seem suspicious for more details.",
-            "Present evidence that directly contradicts what the witness said.",
-            "Pay attention to specific details in statements that don't match evidence."
-        ]
-        
-        import random
-        return random.choice(hints)
+        return random.choice(_GENERAL_HINTS)
     
     def _is_cross_examination_active(self) -> bool:
         """Check if cross-examination is currently active"""
         return (self.trial_state.get("cross_examination") is not None and 
                 self.trial_state["cross_examination"].get("active", False))
     
+    def _set_statements(self, statements: List[Dict[str, Any]]) -> None:
+        """Replace witness statements and rebuild the ID index"""
+        self.witness_statements = statements
+        self._statements_by_id = {s["id"]: s for s in statements}
+    
+    def _count_statement_flags(self) -> Tuple[int, int]:
+        """Count pressed and contradicted statements in one pass"""
+        pressed = contradicted = 0
+        for statement in self.witness_statements:
+            pressed += statement["pressed"]
+            contradicted += statement["contradicted"]
+        return pressed, contradicted
+    
     def _find_statement(self, statement_id: str) -> Optional[Dict[str, Any]]:
         """Find statement by ID"""
-        statement_id = statement_id.upper()
-        for statement in self.witness_statements:
-            if statement["id"] == statement_id:
-                return statement
-        return None
+        return self._statements_by_id.get(statement_id.upper())
     
     def _format_statements_for_display(self) -> List[str]:
         """Format statements for display in cross-examination"""
-        formatted = []
-        for statement in self.witness_statements:
-            prefix = f"{statement['id']}. "
-            indicators = ""
-            
-            if statement["pressed"]:
-                indicators += " [PRESSED]"
-            if statement["contradicted"]:
-                indicators += " [CONTRADICTED]"
-            
-            formatted.append(f"{prefix}{statement['text']}{indicators}")
-        
-        return formatted
+        # One f-string per statement instead of concatenating indicators
+        return [
+            f"{statement['id']}. {statement['text']}"
+            f"{' [PRESSED]' if statement['pressed'] else ''}"
+            f"{' [CONTRADICTED]' if statement['contradicted'] else ''}"
+            for statement in self.witness_statements
+        ]
     
     def _calculate_examination_duration(self) -> str:
         """Calculate cross-examination duration"""
@@ -383,7 +391,6 @@ class TrialPlugin:
             return "unknown"
         
         try:
-            from datetime import datetime
             start_time = datetime.fromisoformat(exam["started_at"].replace('Z', '+00:00'))
             current_time = datetime.now(start_time.tzinfo)
             duration = current_time - start_time
@@ -5,11 +5,16 @@ Immutable event log provides single source of truth.
 Game state is computed from events, preventing corruption.
 """
 
-import json
+import hashlib
+import os
+import shutil
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
+
+from fast_json import loads, dumps, JSONDecodeError
 
 
 class EventStore:
@@ -17,21 +22,34 @@ class EventStore:
     
     def __init__(self, events_file: Path):
         self.events_file = events_file
+        # Sibling paths used on every save, resolved once
+        self._backup_file = events_file.with_suffix('.json.backup')
+        self._temp_file = events_file.with_suffix('.json.temp')
         self._events: List[Dict[str, Any]] = []
+        self._disk_stamp: Optional[tuple] = None  # (mtime_ns, size) last seen on disk
+        self._batch_depth = 0
+        self._dirty = False
         self._load_events()
     
     def _load_events(self) -> None:
         """Load events from disk"""
         if self.events_file.exists():
             try:
-                with open(self.events_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.events_file, 'rb') as f:
+                    data = loads(f.read())
                     self._events = data.get("events", [])
-            except (json.JSONDecodeError, KeyError):
+            except (JSONDecodeError, KeyError):
                 # Corrupted file, start fresh
                 self._events = []
         else:
             self._events = []
+        
+        self._disk_stamp = self._stat_stamp()
+        
+        # Seed the incremental signature from the loaded log
+        self._signature = hashlib.blake2b(digest_size=16)
+        for event in self._events:
+            self._signature.update(event.get("id", "").encode())
     
     def add_event(self, event_data: Dict[str, Any]) -> str:
         """Add new event to the log"""
@@ -46,12 +64,28 @@ class EventStore:
         
         # Add to memory
         self._events.append(event)
+        self._signature.update(event["id"].encode())
         
-        # Persist to disk
-        self._save_events()
+        # Persist to disk, deferred to the end of an open batch
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._save_events()
         
         return event["id"]
     
+    @contextmanager
+    def batch(self) -> Iterator["EventStore"]:
+        """Defer persistence so events added in the block are written once"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._dirty = False
+                self._save_events()
+    
     def get_events(self, since_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get events, optionally since a specific event ID"""
         if since_id is None:
@@ -66,6 +100,10 @@ class EventStore:
         
         return self._events[since_index:].copy()
     
+    def signature(self) -> str:
+        """Get digest of the event log, updated incrementally per event"""
+        return self._signature.hexdigest()
+    
     def get_events_by_type(self, event_type: str) -> List[Dict[str, Any]]:
         """Get all events of a specific type"""
         return [e for e in self._events if e["type"] == event_type]
@@ -75,12 +113,10 @@ class EventStore:
         
         # Create backup before writing
         if self.events_file.exists():
-            backup_file = self.events_file.with_suffix('.json.backup')
-            import shutil
-            shutil.copy2(self.events_file, backup_file)
+            shutil.copy2(self.events_file, self._backup_file)
         
         # Write events atomically
-        temp_file = self.events_file.with_suffix('.json.temp')
+        temp_file = self._temp_file
         
         data = {
             "version": "2.0",
@@ -89,11 +125,24 @@ class EventStore:
             "events": self._events
         }
         
-        with open(temp_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(temp_file, 'wb') as f:
+            f.write(dumps(data, indent=True))
         
         # Atomic move
         temp_file.replace(self.events_file)
+        self._disk_stamp = self._stat_stamp()
+    
+    def _stat_stamp(self) -> Optional[tuple]:
+        """Get (mtime_ns, size) of the events file, or None if missing"""
+        try:
+            st = os.stat(self.events_file)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def is_current(self) -> bool:
+        """Check the events file is unchanged since this store last read or wrote it"""
+        return self._disk_stamp is not None and self._disk_stamp == self._stat_stamp()
     
     def validate_integrity(self) -> Dict[str, Any]:
         """Validate event log integrity"""
@@ -132,26 +181,31 @@ class GameState:
     def __init__(self, event_store: EventStore):
         self.event_store = event_store
         self._cached_state: Optional[Dict[str, Any]] = None
-        self._cache_valid_until_event: Optional[str] = None
+        self._cache_signature: Optional[str] = None
+        self._gates_by_status: Dict[Optional[str], List[Dict[str, Any]]] = {}
+        self._gates_signature: Optional[str] = None
     
     def get_current_state(self) -> Dict[str, Any]:
         """Get current game state computed from all events"""
+        return self.get_state_view().copy()
+    
+    def get_state_view(self) -> Dict[str, Any]:
+        """Get current game state without copying; callers must not mutate it"""
         
         # Check if cache is still valid
-        events = self.event_store.get_events()
-        if (self._cached_state is not None and 
-            events and 
-            events[-1]["id"] == self._cache_valid_until_event):
-            return self._cached_state.copy()
+        signature = self.event_store.signature()
+        if (self._cached_state is not None and
+            signature == self._cache_signature):
+            return self._cached_state
         
         # Rebuild state from events
-        state = self._rebuild_state_from_events(events)
+        state = self._rebuild_state_from_events(self.event_store.get_events())
         
         # Update cache
         self._cached_state = state
-        self._cache_valid_until_event = events[-1]["id"] if events else None
+        self._cache_signature = signature
         
-        return state.copy()
+        return state
     
     def _rebuild_state_from_events(self, events: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Rebuild complete state from event log"""
@@ -211,7 +265,9 @@ class GameState:
         
         elif event_type == "evidence_added":
             evidence_id = event_data.get("id", event_data["name"])
+            # Keep the full plugin record so reloads see every field
             state["evidence"][evidence_id] = {
+                **event_data,
                 "name": event_data["name"],
                 "description": event_data["description"],
                 "added_at": event["timestamp"],
@@ -222,6 +278,7 @@ class GameState:
         elif event_type == "character_met":
             character_id = event_data.get("id", event_data["name"])
             state["characters"][character_id] = {
+                **event_data,
                 "name": event_data["name"],
                 "role": event_data["role"],
                 "trust_level": event_data.get("trust_level", 0),
@@ -281,12 +338,24 @@ class GameState:
         
         # Add more event types as needed...
     
+    def get_gates_by_status(self, status: str) -> List[Dict[str, Any]]:
+        """Get gates with the given status, bucketed once per event log signature"""
+        signature = self.event_store.signature()
+        if signature != self._gates_signature:
+            buckets: Dict[Optional[str], List[Dict[str, Any]]] = {}
+            for gate in self.get_state_view()["gates"]:
+                buckets.setdefault(gate.get("status"), []).append(gate)
+            self._gates_by_status = buckets
+            self._gates_signature = signature
+        
+        return list(self._gates_by_status.get(status, ()))
+    
     def get_state_summary(self) -> Dict[str, Any]:
         """Get high-level summary of current state"""
-        state = self.get_current_state()
+        state = self.get_state_view()
         
-        completed_gates = [g for g in state["gates"] if g.get("status") == "completed"]
-        in_progress_gates = [g for g in state["gates"] if g.get("status") == "in_progress"]
+        completed_gates = self.get_gates_by_status("completed")
+        in_progress_gates = self.get_gates_by_status("in_progress")
         
         return {
             "case_name": state["case_info"].get("case_name", "Unknown"),
@@ -0,0 +1,155 @@
+"""
+Tests for EventStore persistence - batching, disk stamps and signatures
+"""
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add core directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from fast_json import loads
+from state import EventStore, GameState
+
+
+def _location_event(location: str) -> dict:
+    return {"type": "location_changed", "data": {"new_location": location}}
+
+
+def _events_on_disk(events_file: Path) -> list:
+    return loads(events_file.read_bytes())["events"]
+
+
+@pytest.fixture
+def events_file(tmp_path):
+    """Path to a not-yet-created events log"""
+    return tmp_path / "events.json"
+
+
+class TestEventStoreBatch:
+    """Test deferred writes through EventStore.batch()"""
+
+    def test_add_event_writes_immediately_outside_batch(self, events_file):
+        """Test a single event is persisted as soon as it is added"""
+        store = EventStore(events_file)
+
+        store.add_event(_location_event("Office"))
+
+        assert len(_events_on_disk(events_file)) == 1
+
+    def test_nested_batches_write_once(self, events_file):
+        """Test nested batches defer every write to the outermost exit"""
+        store = EventStore(events_file)
+
+        with patch.object(store, "_save_events", wraps=store._save_events) as save:
+            with store.batch():
+                store.add_event(_location_event("Office"))
+                with store.batch():
+                    store.add_event(_location_event("Lobby"))
+                    store.add_event(_location_event("Court"))
+
+                assert save.call_count == 0
+                assert not events_file.exists()
+
+        assert save.call_count == 1
+        assert len(_events_on_disk(events_file)) == 3
+
+    def test_empty_batch_does_not_write(self, events_file):
+        """Test a batch with no new events leaves the disk untouched"""
+        store = EventStore(events_file)
+
+        with store.batch():
+            pass
+
+        assert not events_file.exists()
+
+    def test_batch_persists_events_when_block_raises(self, events_file):
+        """Test events added before an exception are still written"""
+        store = EventStore(events_file)
+
+        with pytest.raises(RuntimeError):
+            with store.batch():
+                store.add_event(_location_event("Office"))
+                raise RuntimeError("boom")
+
+        assert len(_events_on_disk(events_file)) == 1
+
+        # The store is back to writing immediately
+        store.add_event(_location_event("Lobby"))
+        assert len(_events_on_disk(events_file)) == 2
+
+
+class TestEventStoreIsCurrent:
+    """Test disk change detection through EventStore.is_current()"""
+
+    def test_missing_file_is_not_current(self, events_file):
+        """Test a store with no events file on disk is never current"""
+        store = EventStore(events_file)
+
+        assert store.is_current() is False
+
+    def test_current_after_own_write_and_reload(self, events_file):
+        """Test the store's own writes and fresh loads are current"""
+        store = EventStore(events_file)
+        store.add_event(_location_event("Office"))
+
+        assert store.is_current() is True
+        assert EventStore(events_file).is_current() is True
+
+    def test_not_current_after_outside_write(self, events_file):
+        """Test a write by another store makes this store stale"""
+        store = EventStore(events_file)
+        store.add_event(_location_event("Office"))
+
+        other = EventStore(events_file)
+        other.add_event(_location_event("Lobby"))
+
+        assert store.is_current() is False
+        assert other.is_current() is True
+
+
+class TestEventStoreSignature:
+    """Test the incremental event log signature"""
+
+    def test_signature_changes_with_each_event(self, events_file):
+        """Test every added event produces a new signature"""
+        store = EventStore(events_file)
+        signatures = {store.signature()}
+
+        for location in ("Office", "Lobby", "Court"):
+            store.add_event(_location_event(location))
+            signatures.add(store.signature())
+
+        assert len(signatures) == 4
+
+    def test_reloaded_store_has_same_signature(self, events_file):
+        """Test a signature seeded from disk matches the incremental one"""
+        store = EventStore(events_file)
+        store.add_event(_location_event("Office"))
+        store.add_event(_location_event("Lobby"))
+
+        assert EventStore(events_file).signature() == store.signature()
+
+    def test_events_without_id_still_load(self, events_file):
+        """Test a malformed event without an id does not break loading"""
+        events_file.write_text('{"events": [{"type": "location_changed"}]}')
+
+        store = EventStore(events_file)
+
+        assert len(store.get_events()) == 1
+        assert store.signature()
+
+    def test_new_event_invalidates_cached_state(self, events_file):
+        """Test GameState rebuilds once the signature moves on"""
+        store = EventStore(events_file)
+        game_state = GameState(store)
+        store.add_event(_location_event("Office"))
+
+        assert game_state.get_current_state()["current_location"] == "Office"
+
+        store.add_event(_location_event("Lobby"))
+
+        assert game_state.get_current_state()["current_location"] == "Lobby"
+        assert game_state.get_state_view()["metadata"]["event_count"] == 2
@@ -8,22 +8,31 @@ Replaces complex multi-script architecture with single entry point.
 
 import argparse
 import sys
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
 # Add core directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent / "core"))
 
-from engine import CourtRoomEngine
+from engine import CourtRoomEngine, CaseError
 from ai_director import AIDirector
 
 
+# Horizontal rule framing the case opening
+_RULE = "=" * 60
+
+
 class CourtRoomCLI:
     """Main CLI interface for CourtRoom game system"""
     
     def __init__(self):
         self.engine = CourtRoomEngine()
-        self.ai_director = AIDirector()
+    
+    @cached_property
+    def ai_director(self) -> AIDirector:
+        """AI director, built on first use since only gameplay needs it"""
+        return AIDirector()
     
     def create_case(self, case_name: str, test_mode: bool = False) -> None:
         """Create a new mystery case"""
@@ -34,11 +43,11 @@ class CourtRoomCLI:
         
         try:
             case_id = self.engine.create_case(case_name, test_mode=test_mode)
-            print(f"✅ Case created successfully: {case_id}")
-            print(f"📁 Location: cases/{case_id}/")
-            print(f"\nNext step: courtroom play {case_id}")
+            print(f"✅ Case created successfully: {case_id}\n"
+                  f"📁 Location: cases/{case_id}/\n"
+                  f"\nNext step: courtroom play {case_id}")
             
-        except Exception as e:
+        except (CaseError, OSError) as e:
             print(f"❌ Failed to create case: {e}")
             sys.exit(1)
     
@@ -49,10 +58,9 @@ class CourtRoomCLI:
         try:
             # Load case and validate
             if not self.engine.case_exists(case_id):
-                print(f"❌ Case not found: {case_id}")
-                print("Available cases:")
-                for case in self.engine.list_cases():
-                    print(f"  - {case}")
+                lines = [f"❌ Case not found: {case_id}", "Available cases:"]
+                lines.extend(f"  - {case}" for case in self.engine.list_cases())
+                print("\n".join(lines))
                 sys.exit(1)
             
             # Load case state
@@ -60,10 +68,7 @@ class CourtRoomCLI:
             
             # Display opening
             opening = self.engine.get_opening_text()
-            print("\n" + "="*60)
-            print(opening)
-            print("="*60)
-            print("\nType 'next' to continue...")
+            print(f"\n{_RULE}\n{opening}\n{_RULE}\n\nType 'next' to continue...")
             
             user_input = input("> ").strip().lower()
             if user_input == 'next':
@@ -71,7 +76,7 @@ class CourtRoomCLI:
             else:
                 print("Game paused. Use 'courtroom continue' to resume.")
                 
-        except Exception as e:
+        except (CaseError, OSError, EOFError) as e:
             print(f"❌ Failed to start case: {e}")
             sys.exit(1)
     
@@ -85,13 +90,13 @@ class CourtRoomCLI:
             
             # Get current context and start AI-driven gameplay
             context = self.engine.get_resume_context()
-            print(f"\n📋 Current Status: {context['status']}")
-            print(f"🎯 Next Actions: {', '.join(context['available_actions'])}")
+            print(f"\n📋 Current Status: {context['status']}\n"
+                  f"🎯 Next Actions: {', '.join(context['available_actions'])}")
             
             # Start interactive gameplay loop
             self._interactive_gameplay_loop()
             
-        except Exception as e:
+        except (CaseError, OSError) as e:
             print(f"❌ Failed to continue case: {e}")
             sys.exit(1)
     
@@ -110,8 +115,8 @@ class CourtRoomCLI:
                     self._show_gameplay_help()
                 elif user_input.lower() == 'status':
                     context = self.engine.get_resume_context()
-                    print(f"📋 Status: {context['status']}")
-                    print(f"🎯 Available: {', '.join(context['available_actions'])}")
+                    print(f"📋 Status: {context['status']}\n"
+                          f"🎯 Available: {', '.join(context['available_actions'])}")
                 else:
                     # Process input through AI Director
                     response = self.ai_director.process_user_input(
@@ -147,10 +152,12 @@ class CourtRoomCLI:
         """List all available cases"""
         cases = self.engine.list_cases()
         if cases:
-            print("📁 Available cases:")
+            # Collect every line first so the listing is written in one call
+            lines = ["📁 Available cases:"]
             for case in cases:
                 status = self.engine.get_case_status(case)
-                print(f"  - {case} ({status})")
+                lines.append(f"  - {case} ({status})")
+            print("\n".join(lines))
         else:
             print("📁 No cases found. Create one with: courtroom create \"Case Name\"")
     
@@ -159,37 +166,39 @@ class CourtRoomCLI:
         try:
             self.engine.archive_case(case_id)
             print(f"📦 Case archived: {case_id}")
-        except Exception as e:
+        except (CaseError, OSError) as e:
             print(f"❌ Failed to archive case: {e}")
             sys.exit(1)
     
     def doctor(self) -> None:
         """Run system health check"""
         print("🏥 Running system health check...")
+        report = []
         
         # Check virtual environment
         if hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix):
-            print("✅ Virtual environment active")
+            report.append("✅ Virtual environment active")
         else:
-            print("⚠️  Virtual environment not detected")
+            report.append("⚠️  Virtual environment not detected")
         
         # Check dependencies
         try:
             import requests
             import wonderwords
-            print("✅ Required packages available")
+            report.append("✅ Required packages available")
         except ImportError as e:
-            print(f"❌ Missing dependency: {e}")
+            report.append(f"❌ Missing dependency: {e}")
         
         # Check directory structure
         required_dirs = ['core', 'cases', 'tests']
         for dir_name in required_dirs:
             if Path(dir_name).exists():
-                print(f"✅ Directory exists: {dir_name}")
+                report.append(f"✅ Directory exists: {dir_name}")
             else:
-                print(f"❌ Missing directory: {dir_name}")
+                report.append(f"❌ Missing directory: {dir_name}")
         
-        print("🏥 Health check complete")
+        report.append("🏥 Health check complete")
+        print("\n".join(report))
 
 
 def main():
@@ -258,6 +267,9 @@ Examples:
     except KeyboardInterrupt:
         print("\n\nOperation cancelled.")
         sys.exit(1)
+    except Exception as e:
+        print(f"❌ Unexpected error: {e}")
+        sys.exit(1)
 
 
 if __name__ == '__main__':